@@ -49,37 +49,28 @@ def expand_columns(
 
     This is used to expand when multiple labels are present on the same bug.
     """
-    records = df.to_dict('records')
-
-    initial_n_records = len(records)
+    initial_n_records = len(df)
     if not isinstance(col_to_expand, list):
         col_to_expand = [col_to_expand]
     for col in col_to_expand:
-        new_records = []
-        for r in records:
-            try:
-                assert isinstance(r[col], str)
-            except AssertionError:
-                print(r)
-            for token in r[col].split(","):
-                new_r = dict(r)
-                new_r[col] = token.strip()
-                new_records.append(new_r)
-        records = new_records
-    n_annotations = len(records)
+        not_str = ~df[col].map(lambda e: isinstance(e, str))
+        for r in df[not_str].to_dict('records'):
+            print(r)
+        df = df.assign(**{col: df[col].str.split(",")}).explode(
+            col, ignore_index=True)
+        df[col] = df[col].str.strip()
+    n_annotations = len(df)
     print(
         f"{initial_n_records} records received {n_annotations} annotations"
         f" in the column(s): {col_to_expand}."
     )
-    return df.from_dict(records)
+    return df
 
 
 def normalize_complexity(df: pd.DataFrame, verbose: bool) -> pd.DataFrame:
     """Regularize the complexity column between 0 to 20."""
     before = len(df)
-    df["complexity"] = df["complexity"].apply(
-        lambda e: "100" if e == "100+" else e
-    )
+    df["complexity"] = df["complexity"].replace("100+", "100")
     df.dropna(subset=['complexity'], inplace=True)
     df["complexity"] = df["complexity"].astype(int)
     after = len(df)
@@ -90,9 +81,7 @@ def normalize_complexity(df: pd.DataFrame, verbose: bool) -> pd.DataFrame:
 
 def cap_max_value(df: pd.DataFrame, column_to_inspect: str, max_value: int):
     """Cap the maximum value of the column."""
-    df[column_to_inspect] = df[column_to_inspect].apply(
-        lambda e: max_value if e > max_value else e
-    )
+    df[column_to_inspect] = df[column_to_inspect].clip(upper=max_value)
     return df
 
 
@@ -136,9 +125,11 @@ def plot_bar_chart_quantum_vs_classical(
         column_to_inspect).count().sort_values(
         by='type', ascending=False).index)
 
-    for component in df[column_to_inspect].unique():
-        if component not in categories_q_bugs:
-            categories_q_bugs.append(component)
+    seen = set(categories_q_bugs)
+    categories_q_bugs += [
+        component for component in df[column_to_inspect].unique()
+        if component not in seen
+    ]
 
     args = {
         "hue": "type",
@@ -254,15 +245,10 @@ def plot_diagram_value(
         ):
     """Print the values for the diagram."""
     df = expand_columns(df_bugs, column_to_inspect)
-    records = []
-    for col_value in list(df[column_to_inspect].unique()):
-        count = len(df[df[column_to_inspect] == col_value])
-        if latex_format and mapping_latex is not None:
-            col_value = mapping_latex[col_value]
-        records.append(
-            {"code": col_value, "count": count}
-        )
-    df_agg = pd.DataFrame.from_records(records)
+    counts = df[column_to_inspect].value_counts()
+    if latex_format and mapping_latex is not None:
+        counts.index = counts.index.map(lambda e: mapping_latex[e])
+    df_agg = counts.rename_axis("code").reset_index(name="count")
     df_agg = df_agg.groupby("code").sum().reset_index()
     print("-" * 80)
     for i, row in df_agg.iterrows():
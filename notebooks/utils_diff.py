@@ -2,13 +2,18 @@
 
 import os
 import difflib as dl
+import itertools
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import json
+import re
 from typing import List
 
 
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,\d+)? \+(\d+)")
+
+
 def read_content(path):
     """Read the content of a file."""
     with open(path, 'r') as in_file:
@@ -20,53 +25,38 @@ def iterate_over(folder_master, folder_slave):
 
     Note that only files in common are returned.
     """
-    files_in_master = [
-        f for f in os.listdir(folder_master)
-        if os.path.isfile(os.path.join(folder_master, f))
-    ]
-    files_in_slave = [
-        f for f in os.listdir(folder_slave)
-        if os.path.isfile(os.path.join(folder_slave, f))
-    ]
-    files_in_common = set(files_in_master).intersection(set(files_in_slave))
+    with os.scandir(folder_master) as entries:
+        files_in_master = {e.name: e.path for e in entries if e.is_file()}
+    with os.scandir(folder_slave) as entries:
+        files_in_slave = {e.name: e.path for e in entries if e.is_file()}
+    files_in_common = files_in_master.keys() & files_in_slave.keys()
     results = []
 
     for filename in files_in_common:
-        file_master = os.path.join(folder_master, filename)
-        file_slave = os.path.join(folder_slave, filename)
-        # print(file_master)
-        # print(file_slave)
-        content_master = read_content(file_master)
-        content_slave = read_content(file_slave)
+        content_master = read_content(files_in_master[filename])
+        content_slave = read_content(files_in_slave[filename])
         item = (filename, content_master, content_slave)
         results.append(item)
     return results
 
 
 def get_line_numbers(line):
-    token = line.split(" ")
-    numbers_old_file = token[1]
-    numbers_new_file = token[2]
-    delete_line_number = (
-        int(numbers_old_file.split(",")[0].replace("-", "")) - 1
-    )
-    additions_line_number = int(numbers_new_file.split(",")[0]) - 1
+    match = HUNK_HEADER.match(line)
+    delete_line_number = int(match.group(1)) - 1
+    additions_line_number = int(match.group(2)) - 1
     return delete_line_number, additions_line_number
 
 
-def get_hunks(text_diff):
-    """Extract the hunks form the unified diff."""
-    lines = text_diff.split("\n")
-    modified_lines = {
-        "added": [],
-        "deleted": [],
-    }
+def iter_hunks(text_diff):
+    """Yield the hunks of the unified diff (text or iterable of lines)."""
+    if isinstance(text_diff, str):
+        lines = text_diff.split("\n")
+    else:
+        lines = text_diff
 
     count_deletions = 0
     count_additions = 0
 
-    chunks = []
-
     # there are different section types:
     # header, unchanged_text, add_section, del_section
     c_section = 'unchanged_text'
@@ -77,7 +67,6 @@ def get_hunks(text_diff):
     }
 
     for line in lines:
-        line = line.rstrip()
         count_deletions += 1
         count_additions += 1
 
@@ -85,26 +74,26 @@ def get_hunks(text_diff):
             c_section = 'header'
             count_deletions, count_additions = get_line_numbers(line)
             # initialize a new dictionary for the change hunk
-            chunk = {
-                "added": [],
-                "deleted": [],
-            }
+            # (the current one is reused if nothing was collected yet)
+            if chunk["added"] or chunk["deleted"]:
+                chunk = {
+                    "added": [],
+                    "deleted": [],
+                }
 
         elif line.startswith("-"):
             c_section = 'del_section'
-            modified_lines["deleted"].append((count_deletions, line[1:]))
             count_additions -= 1
             # append this line as deleted line of this change hunk
             chunk["deleted"].append((count_deletions, line[1:]))
 
         elif line.startswith("+"):
             c_section = 'add_section'
-            modified_lines["added"].append((count_additions, line[1:]))
             count_deletions -= 1
             # append this line as added line of this change hunk
             chunk["added"].append((count_additions, line[1:]))
 
-        elif line == r"\ No newline at end of file":
+        elif line.startswith(r"\ No newline at end of file"):
             count_deletions -= 1
             count_additions -= 1
 
@@ -113,7 +102,7 @@ def get_hunks(text_diff):
             # if we came out of a change hunk section we can close this chunk
             # and append it to the chunks list
             if c_section != prev_section and prev_section != 'header':
-                chunks.append(chunk)
+                yield chunk
                 chunk = {
                     "added": [],
                     "deleted": [],
@@ -123,9 +112,12 @@ def get_hunks(text_diff):
 
     # flush the last change (if present)
     if len(chunk['added']) > 0 or len(chunk['deleted']) > 0:
-        chunks.append(chunk)
+        yield chunk
 
-    return chunks
+
+def get_hunks(text_diff):
+    """Extract the hunks form the unified diff (text or iterable of lines)."""
+    return list(iter_hunks(text_diff))
 
 
 def compute_diff_per_file(
@@ -137,11 +129,10 @@ def compute_diff_per_file(
     for repo_name in repos_subfolders:
 
         path_repo = os.path.join(path_repo_folder, repo_name)
-        repo_bugs = os.listdir(path_repo)
-
-        for bug_folder_name in repo_bugs:
+        with os.scandir(path_repo) as entries:
+            repo_bugs = [e.path for e in entries if e.is_dir()]
 
-            path_bug_folder = os.path.join(path_repo, bug_folder_name)
+        for path_bug_folder in repo_bugs:
 
             folder_before = os.path.join(path_bug_folder, "before")
             folder_after = os.path.join(path_bug_folder, "after")
@@ -154,33 +145,33 @@ def compute_diff_per_file(
             for name, content_before, content_after in iterate_over(
                     folder_master=folder_before,
                     folder_slave=folder_after):
+                # identical files have no hunks, skip the diff
+                if content_before == content_after:
+                    continue
                 diffs = dl.unified_diff(
                     content_before.splitlines(False),
-                    content_after.splitlines(False))
-                text_diff = "\n".join(list(diffs))
+                    content_after.splitlines(False),
+                    lineterm="")
                 # remove the useless preface before the "@@" character
-                text_diff = text_diff[text_diff.find("@@"):]
+                diff_lines = itertools.dropwhile(
+                    lambda line: not line.startswith("@@"), diffs)
                 # print(name)
                 # print(text_diff)
                 # print("-" * 80)
                 # print("HUNKS:")
                 # print("-" * 80)
-                hunks = get_hunks(text_diff)
-                # count the lines
+                # count the hunks and the lines
+                n_hunks = 0
                 n_modified_lines = 0
-                for h_i, hunk in enumerate(hunks):
-                    # print(f"Hunk {h_i}")
-                    # print(hunk)
-                    i_modified_lines = max(
-                        len(hunk["deleted"]),
-                        len(hunk["added"])
-                    )
-                    n_modified_lines += i_modified_lines
+                for hunk in iter_hunks(diff_lines):
+                    n_hunks += 1
+                    n_modified_lines += max(
+                        len(hunk["deleted"]), len(hunk["added"]))
                 # if the file has any change, store it
-                if len(hunks) > 0:
+                if n_hunks > 0:
                     report = {
                         "n_lines": n_modified_lines,
-                        "n_hunks": len(hunks),
+                        "n_hunks": n_hunks,
                         "filename": name,
                         "n_files": 1,
                         **metadata
@@ -197,9 +188,9 @@ def compute_diff_per_bug(
     df_reports = compute_diff_per_file(path_repo_folder, repos_subfolders)
     df_grouped = df_reports.groupby(
         by=["human_id", "id", "project_name", "commit_hash"]
-        ).sum().reset_index()
-    df_grouped["comprehensive_id"] = df_grouped.apply(
-        lambda row: f'{row["human_id"]} ({row["id"]})',
-        axis=1
+        )[["n_lines", "n_hunks", "n_files"]].sum().reset_index()
+    df_grouped["comprehensive_id"] = (
+        df_grouped["human_id"].astype(str) + " (" +
+        df_grouped["id"].astype(str) + ")"
     )
     return df_grouped